@@ -25,33 +25,110 @@
 
 import dearpygui.dearpygui as dpg
 from pathlib import Path
-from typing import Optional, List, Dict, Tuple, NamedTuple
+from typing import Optional, List, Dict, Tuple, NamedTuple, Sequence
 from dataclasses import dataclass
+from array import array
+from types import ModuleType
+import bisect
+import functools
+import itertools
+import operator
+import queue
 import subprocess
+import threading
 import re
 import os
-import difflib
 
 
-@dataclass
+@functools.lru_cache(maxsize=None)
+def _import_pygit2() -> Optional[ModuleType]:
+    """The optional libgit2 bindings, or None; imported on first use since they are slow to load"""
+    try:
+        import pygit2
+    except ImportError:
+        return None
+    return pygit2
+
+
+# Line breaks other than '\n' that str.splitlines() also splits on
+_LINE_BREAK_RE = re.compile('[\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029]')
+
+# Conflict marker lines after the first line; the match starts at the preceding newline
+# so the regex engine can skip ahead with a literal search
+_CONFLICT_MARKER_RE = re.compile(r'\n(<{7}|\|{7}|={7}|>{7})')
+
+# A whole conflict marker line, including its line break
+_MARKER_LINE_RE = re.compile(r'^(?:<{7}|\|{7}|={7}|>{7}).*\n?', re.MULTILINE)
+
+# Section codes for each line of the working copy when highlighting conflicts
+_SECTION_OTHER = 0
+_SECTION_LOCAL = 1
+_SECTION_REMOTE = 2
+_SECTION_START_MARKER = 3
+_SECTION_MIDDLE_MARKER = 4
+_SECTION_END_MARKER = 5
+_SECTION_BASE_MARKER = 6
+
+# Highlight prefix for each section code
+_SECTION_PREFIXES = (
+    "",
+    "🟢 LOCAL: ",
+    "🔴 REMOTE: ",
+    "🔴 CONFLICT START: ",
+    "🟡 CONFLICT MIDDLE: ",
+    "🔴 CONFLICT END: ",
+    "🔵 BASE MARKER: ",
+)
+
+# Strips the prefix added to each line, leaving the original line (including git markers)
+_HIGHLIGHT_STRIP_RE = re.compile('(?m)^(?:' + '|'.join(map(re.escape, _SECTION_PREFIXES[1:])) + ')')
+
+# Marker lines are highlighted as markers wherever they are, keyed by the marker itself
+_MARKER_SECTIONS = {
+    '<<<<<<<': _SECTION_START_MARKER,
+    '=======': _SECTION_MIDDLE_MARKER,
+    '>>>>>>>': _SECTION_END_MARKER,
+    '|||||||': _SECTION_BASE_MARKER,
+}
+
+# How long typing has to pause before the working copy is re-parsed
+_EDIT_DEBOUNCE_SECONDS = 0.15
+
+
+@dataclass(slots=True)
 class ConflictMarkers:
     """Git conflict markers in a file"""
     start: int
     middle: int
     end: int
-    base_content: List[str]
-    local_content: List[str]
-    remote_content: List[str]
+    base_content: Sequence[str]
+    local_content: Sequence[str]
+    remote_content: Sequence[str]
     conflict_id: int
     is_resolved: bool = False
     resolved_with: Optional[str] = None  # 'local', 'remote', 'base', or 'manual'
     original_start: int = 0
     original_end: int = 0
-    resolved_lines: List[str] = None  # What was actually chosen
-    rejected_lines: List[str] = None  # What was rejected (for highlighting)
+    resolved_lines: Optional[Sequence[str]] = None  # What was actually chosen
+    rejected_lines: Optional[Sequence[str]] = None  # What was rejected (for highlighting)
+    base_hash: int = 0  # Hashes of the sections, for cheap inequality checks
+    local_hash: int = 0
+    remote_hash: int = 0
+    original_lines: Sequence[str] = ()  # The conflict as parsed, markers included, for reverting
 
 
-@dataclass
+class ConflictSpan(NamedTuple):
+    """Line positions and sections of a parsed conflict"""
+    start: int
+    middle: int
+    end: int
+    base_content: Tuple[str, ...]
+    local_content: Tuple[str, ...]
+    remote_content: Tuple[str, ...]
+    lines: Tuple[str, ...]  # Every line from the start marker to the end marker
+
+
+@dataclass(slots=True)
 class DiffHighlight:
     """Represents a highlighted diff region"""
     start_line: int
@@ -73,146 +150,301 @@ class GitRepository:
     
     def __init__(self, repo_path: Optional[Path] = None):
         self.repo_path = repo_path or Path.cwd()
+        self._catfile: Optional[subprocess.Popen] = None
+        self._repo = None  # pygit2.Repository when libgit2 bindings are installed
+        self._status_cache: Optional[List[GitFileStatus]] = None
         self._validate_repo()
     
     def _validate_repo(self) -> bool:
         """Check if current directory is a git repository"""
-        try:
-            result = subprocess.run(
-                ['git', 'rev-parse', '--git-dir'],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            return True
-        except subprocess.CalledProcessError:
-            return False
+        pygit2 = _import_pygit2()
+        if pygit2 is not None:
+            git_dir = pygit2.discover_repository(str(self.repo_path))
+            if git_dir is None:
+                return False
+            try:
+                self._repo = pygit2.Repository(git_dir)
+            except pygit2.GitError:
+                # libgit2 can reject repositories the git CLI handles (extensions, ownership checks)
+                self._repo = None
+        
+        self._status_cache = self._read_status()
+        return self._status_cache is not None
+    
+    def _read_status(self) -> Optional[List[GitFileStatus]]:
+        """Read unmerged entries from git status, or None if this isn't a repository"""
+        if self._repo is not None:
+            return self._read_index_conflicts()
+        
+        result = subprocess.run(
+            ['git', 'status', '--porcelain=v2', '-z', '-uno'],
+            cwd=self.repo_path,
+            capture_output=True
+        )
+        if result.returncode != 0:
+            return None
+        
+        files = []
+        records = iter(result.stdout.decode('utf-8', errors='replace').split('\0'))
+        for record in records:
+            if record.startswith('u '):
+                # u <XY> <sub> <m1> <m2> <m3> <mW> <h1> <h2> <h3> <path>
+                files.append(GitFileStatus(
+                    path=Path(record.split(' ', 10)[10]),
+                    status='unmerged',
+                    has_conflicts=True
+                ))
+            elif record.startswith('2 '):
+                # Renames carry the original path as an extra record
+                next(records, None)
+        return files
+    
+    def _read_index_conflicts(self) -> List[GitFileStatus]:
+        """Read unmerged entries straight from the index with libgit2"""
+        index = self._repo.index
+        index.read()
+        
+        files = []
+        for ancestor, ours, theirs in index.conflicts or ():
+            entry = ours or theirs or ancestor
+            files.append(GitFileStatus(
+                path=Path(entry.path),
+                status='unmerged',
+                has_conflicts=True
+            ))
+        return files
     
     def get_conflicted_files(self) -> List[GitFileStatus]:
         """Get list of files with merge conflicts"""
-        try:
-            result = subprocess.run(
-                ['git', 'diff', '--name-only', '--diff-filter=U'],
+        # The status read while validating the repo is only good for the first scan
+        files, self._status_cache = self._status_cache, None
+        if files is None:
+            files = self._read_status()
+        return files or []
+    
+    def _read_blob(self, spec: str) -> Optional[bytes]:
+        """Read an object through a long-running `git cat-file --batch` process"""
+        if self._catfile is None or self._catfile.poll() is not None:
+            self._catfile = subprocess.Popen(
+                ['git', 'cat-file', '--batch'],
                 cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                check=True
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
             )
-            
-            files = []
-            for line in result.stdout.strip().split('\n'):
-                if line:
-                    files.append(GitFileStatus(
-                        path=Path(line),
-                        status='unmerged',
-                        has_conflicts=True
-                    ))
-            return files
-            
-        except subprocess.CalledProcessError:
-            return []
+        
+        self._catfile.stdin.write(f"{spec}\n".encode('utf-8'))
+        self._catfile.stdin.flush()
+        
+        # Header is either "<sha> <type> <size>" or "<spec> missing"
+        header = self._catfile.stdout.readline().rstrip(b'\n')
+        if not header or header.endswith(b' missing') or header.endswith(b' ambiguous'):
+            return None
+        
+        _, object_type, size = header.rsplit(b' ', 2)
+        data = self._catfile.stdout.read(int(size))
+        self._catfile.stdout.read(1)  # trailing newline
+        return data if object_type == b'blob' else None
     
     def get_file_versions(self, file_path: Path) -> Dict[str, str]:
         """Get different versions of a file (base, local, remote)"""
         versions = {}
         
-        try:
-            # Get base version (common ancestor) - stage 1
-            result = subprocess.run(
-                ['git', 'show', f':1:{file_path}'],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True
-            )
-            if result.returncode == 0:
-                versions['base'] = result.stdout
-            
-            # Get local version (our side/HEAD) - stage 2  
-            result = subprocess.run(
-                ['git', 'show', f':2:{file_path}'],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True
-            )
-            if result.returncode == 0:
-                versions['local'] = result.stdout
+        if self._repo is not None:
+            conflicts = self._repo.index.conflicts
+            try:
+                stages = conflicts[file_path.as_posix()] if conflicts is not None else ()
+            except KeyError:
+                stages = ()
             
-            # Get remote version (their side) - stage 3
-            result = subprocess.run(
-                ['git', 'show', f':3:{file_path}'],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True
-            )
-            if result.returncode == 0:
-                versions['remote'] = result.stdout
+            for name, entry in zip(('base', 'local', 'remote'), stages):
+                if entry is not None:
+                    versions[name] = self._repo[entry.id].data.decode('utf-8', errors='replace')
+            return versions
+        
+        try:
+            # Stage 1 is the common ancestor, 2 is our side (HEAD), 3 is their side
+            for stage, name in ((1, 'base'), (2, 'local'), (3, 'remote')):
+                data = self._read_blob(f":{stage}:{file_path}")
+                if data is not None:
+                    versions[name] = data.decode('utf-8', errors='replace')
                 
-        except subprocess.CalledProcessError:
-            pass
+        except (OSError, ValueError):
+            self.close()
         
         return versions
     
-    def parse_conflict_markers(self, content: str) -> List[ConflictMarkers]:
-        """Parse Git conflict markers from file content"""
-        lines = content.splitlines()
-        conflicts = []
-        i = 0
-        conflict_id = 0
+    def close(self) -> None:
+        """Terminate the background git process"""
+        if self._catfile is None:
+            return
         
-        while i < len(lines):
-            line = lines[i]
-            
-            if line.startswith('<<<<<<<'):
-                start_idx = i
-                local_content = []
-                base_content = []
-                remote_content = []
+        try:
+            self._catfile.stdin.close()
+            self._catfile.wait(timeout=1)
+        except (OSError, subprocess.TimeoutExpired):
+            self._catfile.kill()
+            self._catfile.wait()
+        self._catfile = None
+    
+    def __del__(self):
+        self.close()
+    
+    @staticmethod
+    def _next_line(content: str, pos: int) -> int:
+        """Offset of the line after the one containing pos"""
+        found = content.find('\n', pos)
+        return found + 1 if found >= 0 else len(content)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _scan_conflicts(content: str) -> Tuple[Tuple[ConflictSpan, ...], bool]:
+        """Find conflict spans in content, and whether the scan ended outside of a conflict"""
+        # Line numbers follow splitlines(), so make every line break a plain newline first
+        if _LINE_BREAK_RE.search(content):
+            content = '\n'.join(content.splitlines())
+        
+        next_line = GitRepository._next_line
+        spans = []
+        line = 0
+        counted = 0
+        
+        # Walk the marker lines in one pass, only splitting the conflict sections into lines.
+        # section is the marker that opened the part being read, or None outside a conflict
+        section = None
+        marker_positions = itertools.chain(
+            [0] if content.startswith('<<<<<<<') else [],
+            (match.start(1) for match in _CONFLICT_MARKER_RE.finditer(content))
+        )
+        for pos in marker_positions:
+            marker = content[pos]
+            if marker == '<':
+                if section is None:
+                    start, base_marker, section = pos, -1, '<'
+            elif marker == '|':
+                if section == '<':
+                    base_marker, section = pos, '|'
+            elif marker == '=':
+                if section == '<' or section == '|':
+                    middle, section = pos, '='
+            elif section == '=':
+                end, section = pos, None
                 
-                i += 1
-                while i < len(lines) and not lines[i].startswith('|||||||') and not lines[i].startswith('======='):
-                    local_content.append(lines[i])
-                    i += 1
+                line += content.count('\n', counted, start)
+                start_idx = line
+                middle_idx = start_idx + content.count('\n', start, middle)
+                end_idx = middle_idx + content.count('\n', middle, end)
+                line, counted = end_idx, end
                 
-                if i < len(lines) and lines[i].startswith('|||||||'):
-                    i += 1
-                    while i < len(lines) and not lines[i].startswith('======='):
-                        base_content.append(lines[i])
-                        i += 1
+                local_start = next_line(content, start)
+                if base_marker >= 0:
+                    local_end, base_start = base_marker, next_line(content, base_marker)
+                else:
+                    local_end = base_start = middle
+                remote_start = next_line(content, middle)
                 
-                if i < len(lines) and lines[i].startswith('======='):
-                    middle_idx = i
-                    i += 1
-                    
-                    while i < len(lines) and not lines[i].startswith('>>>>>>>'):
-                        remote_content.append(lines[i])
-                        i += 1
-                    
-                    if i < len(lines) and lines[i].startswith('>>>>>>>'):
-                        end_idx = i
-                        conflicts.append(ConflictMarkers(
-                            start=start_idx,
-                            middle=middle_idx,
-                            end=end_idx,
-                            base_content=base_content,
-                            local_content=local_content,
-                            remote_content=remote_content,
-                            conflict_id=conflict_id
-                        ))
-                        conflict_id += 1
-            i += 1
-        
-        return conflicts
+                base_content = tuple(content[base_start:middle].splitlines())
+                local_content = tuple(content[local_start:local_end].splitlines())
+                remote_content = tuple(content[remote_start:end].splitlines())
+                
+                # Rebuild the whole conflict from its sections, sharing their line strings
+                base_lines = ()
+                if base_marker >= 0:
+                    base_lines = (content[base_marker:base_start].rstrip('\n'), *base_content)
+                spans.append(ConflictSpan(
+                    start=start_idx,
+                    middle=middle_idx,
+                    end=end_idx,
+                    base_content=base_content,
+                    local_content=local_content,
+                    remote_content=remote_content,
+                    lines=(
+                        content[start:local_start].rstrip('\n'), *local_content, *base_lines,
+                        content[middle:remote_start].rstrip('\n'), *remote_content,
+                        content[end:next_line(content, end)].rstrip('\n')
+                    )
+                ))
+        
+        return tuple(spans), section is None
+    
+    @staticmethod
+    def _build_conflicts(spans: Sequence[ConflictSpan]) -> List[ConflictMarkers]:
+        """Create fresh conflict records from parsed spans"""
+        return [
+            ConflictMarkers(
+                start=span.start,
+                middle=span.middle,
+                end=span.end,
+                base_content=span.base_content,
+                local_content=span.local_content,
+                remote_content=span.remote_content,
+                conflict_id=conflict_id,
+                base_hash=hash(span.base_content),
+                local_hash=hash(span.local_content),
+                remote_hash=hash(span.remote_content),
+                original_lines=span.lines
+            )
+            for conflict_id, span in enumerate(spans)
+        ]
+    
+    @staticmethod
+    def parse_conflict_markers(content: str) -> List[ConflictMarkers]:
+        """Parse Git conflict markers from file content"""
+        spans, _ = GitRepository._scan_conflicts(content)
+        return GitRepository._build_conflicts(spans)
+    
+    @staticmethod
+    def reparse_conflict_markers(old_content: str, new_content: str) -> List[ConflictMarkers]:
+        """Parse Git conflict markers after an edit, only re-scanning the changed lines"""
+        old_spans, old_complete = GitRepository._scan_conflicts(old_content)
+        if not old_complete:
+            return GitRepository.parse_conflict_markers(new_content)
+        
+        old_lines = old_content.splitlines()
+        new_lines = new_content.splitlines()
+        prefix, suffix = DiffHighlighter.common_affixes(old_lines, new_lines)
+        delta = len(new_lines) - len(old_lines)
+        
+        # Conflicts entirely outside the edited lines are unchanged, apart from moving.
+        # Spans don't overlap, so both their starts and ends are sorted
+        before = list(old_spans[:bisect.bisect_left(old_spans, prefix, key=operator.attrgetter('end'))])
+        after = old_spans[bisect.bisect_left(old_spans, len(old_lines) - suffix, key=operator.attrgetter('start')):]
+        
+        window_start = before[-1].end + 1 if before else 0
+        window_end = after[0].start + delta if after else len(new_lines)
+        window_spans, complete = GitRepository._scan_conflicts('\n'.join(new_lines[window_start:window_end]))
+        if not complete:
+            # An unterminated conflict would swallow the ones after it
+            return GitRepository.parse_conflict_markers(new_content)
+        
+        spans = before
+        for offset, moved in ((window_start, window_spans), (delta, after)):
+            spans.extend(
+                span._replace(start=span.start + offset, middle=span.middle + offset, end=span.end + offset)
+                for span in moved
+            )
+        return GitRepository._build_conflicts(spans)
+    
+    def _stage_paths(self, paths: Sequence[Path]) -> None:
+        """Stage files by streaming their paths to git update-index"""
+        # update-index holds index.lock until it exits, so it can't be left running between calls
+        subprocess.run(
+            ['git', 'update-index', '--add', '-z', '--stdin'],
+            cwd=self.repo_path,
+            input=b''.join(os.fsencode(path) + b'\0' for path in paths),
+            check=True
+        )
     
     def resolve_conflict(self, file_path: Path, resolved_content: str) -> bool:
         """Mark conflict as resolved by writing content and staging"""
+        return self.resolve_conflicts([(file_path, resolved_content)])
+    
+    def resolve_conflicts(self, resolutions: Sequence[Tuple[Path, str]]) -> bool:
+        """Mark several conflicts as resolved, writing every file before staging them together"""
         try:
-            (self.repo_path / file_path).write_text(resolved_content, encoding='utf-8')
-            subprocess.run(
-                ['git', 'add', str(file_path)],
-                cwd=self.repo_path,
-                check=True
-            )
+            for file_path, resolved_content in resolutions:
+                (self.repo_path / file_path).write_text(resolved_content, encoding='utf-8')
+            self._stage_paths([file_path for file_path, _ in resolutions])
             return True
             
         except (subprocess.CalledProcessError, IOError):
@@ -222,48 +454,150 @@ class GitRepository:
 class DiffHighlighter:
     """Handles diff highlighting and visualization"""
     
+    _HIGHLIGHT_PREFIXES = {'added': "[+] ", 'removed': "[-] "}
+    
+    @staticmethod
+    def common_affixes(a: List[str], b: List[str]) -> Tuple[int, int]:
+        """Count the lines two sequences share at their start and at their end"""
+        limit = min(len(a), len(b))
+        prefix = 0
+        while prefix < limit and a[prefix] == b[prefix]:
+            prefix += 1
+        
+        limit -= prefix
+        suffix = 0
+        while suffix < limit and a[-1 - suffix] == b[-1 - suffix]:
+            suffix += 1
+        
+        return prefix, suffix
+    
+    @staticmethod
+    def _myers(a: Sequence[int], b: Sequence[int]) -> List[str]:
+        """Shortest edit script from a to b as 'keep'/'delete'/'insert' steps (Myers O(ND))"""
+        n, m = len(a), len(b)
+        offset = n + m + 1
+        v = array('i', [0]) * (2 * offset + 1)
+        trace = []
+        
+        # Forward pass: furthest reaching x on each diagonal k, for growing edit counts d
+        for d in range(n + m + 1):
+            trace.append(v[offset - d - 1:offset + d + 2])
+            for k in range(-d, d + 1, 2):
+                if k == -d or (k != d and v[offset + k - 1] < v[offset + k + 1]):
+                    x = v[offset + k + 1]
+                else:
+                    x = v[offset + k - 1] + 1
+                y = x - k
+                while x < n and y < m and a[x] == b[y]:
+                    x += 1
+                    y += 1
+                v[offset + k] = x
+                if x >= n and y >= m:
+                    break
+            else:
+                continue
+            break
+        
+        # Walk the saved frontiers back from (n, m) to recover the path
+        steps = []
+        x, y = n, m
+        for d in range(len(trace) - 1, -1, -1):
+            frontier = trace[d]
+            k = x - y
+            if k == -d or (k != d and frontier[k + d] < frontier[k + d + 2]):
+                prev_k = k + 1
+            else:
+                prev_k = k - 1
+            prev_x = frontier[prev_k + d + 1]
+            prev_y = prev_x - prev_k
+            
+            while x > prev_x and y > prev_y:
+                steps.append('keep')
+                x -= 1
+                y -= 1
+            if d > 0:
+                steps.append('insert' if x == prev_x else 'delete')
+            x, y = prev_x, prev_y
+        
+        # Within each run of changes list the deletions before the insertions
+        script = []
+        deleted = inserted = 0
+        for step in reversed(steps):
+            if step == 'delete':
+                deleted += 1
+            elif step == 'insert':
+                inserted += 1
+            else:
+                script += ['delete'] * deleted + ['insert'] * inserted
+                script.append(step)
+                deleted = inserted = 0
+        script += ['delete'] * deleted + ['insert'] * inserted
+        
+        return script
+    
+    @staticmethod
+    def intern_lines(lines: Sequence[str], pool: Dict[str, int]) -> List[int]:
+        """Map lines to integer IDs, adding lines not seen before to the pool"""
+        return [pool.setdefault(line, len(pool)) for line in lines]
+    
+    @staticmethod
+    def _diff_ops(a_lines: List[str], b_lines: List[str],
+                  pool: Optional[Dict[str, int]] = None) -> List[Tuple[str, int, int]]:
+        """Diff two line lists into (step, index in a, index in b) tuples"""
+        prefix, suffix = DiffHighlighter.common_affixes(a_lines, b_lines)
+        
+        # Compare lines as small integers instead of full strings
+        if pool is None:
+            pool = {}
+        a = DiffHighlighter.intern_lines(a_lines[prefix:len(a_lines) - suffix], pool)
+        b = DiffHighlighter.intern_lines(b_lines[prefix:len(b_lines) - suffix], pool)
+        
+        ops = []
+        i = j = 0
+        for step in ['keep'] * prefix + DiffHighlighter._myers(a, b) + ['keep'] * suffix:
+            ops.append((step, i, j))
+            if step != 'insert':
+                i += 1
+            if step != 'delete':
+                j += 1
+        
+        return ops
+    
+    @staticmethod
+    def _format_range(start: int, length: int) -> str:
+        """Format a hunk range the way unified diff headers do"""
+        if length == 1:
+            return str(start + 1)
+        if not length:
+            return f"{start},0"
+        return f"{start + 1},{length}"
+    
     @staticmethod
-    def generate_line_diff(chosen_lines: List[str], rejected_lines: List[str]) -> List[DiffHighlight]:
+    def generate_line_diff(chosen_lines: List[str], rejected_lines: List[str],
+                           pool: Optional[Dict[str, int]] = None) -> List[DiffHighlight]:
         """Generate line-by-line diff highlights between chosen and rejected content"""
         highlights = []
         
-        if not chosen_lines and not rejected_lines:
+        if chosen_lines == rejected_lines:
             return highlights
         
-        # Use difflib to get detailed diff
-        differ = difflib.unified_diff(
-            rejected_lines, chosen_lines,
-            lineterm='', n=0
-        )
-        
-        diff_lines = list(differ)
-        current_line = 0
-        
-        for line in diff_lines:
-            if line.startswith('@@'):
-                # Parse hunk header to get line numbers
-                match = re.search(r'-(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))?', line)
-                if match:
-                    current_line = int(match.group(3)) - 1
-            elif line.startswith('-'):
+        for step, i, j in DiffHighlighter._diff_ops(rejected_lines, chosen_lines, pool):
+            if step == 'delete':
                 # Line was removed (was in rejected, not in chosen)
                 highlights.append(DiffHighlight(
-                    start_line=current_line,
-                    end_line=current_line + 1,
+                    start_line=j,
+                    end_line=j + 1,
                     highlight_type='removed',
-                    content=[line[1:]]
+                    content=[rejected_lines[i]]
                 ))
-            elif line.startswith('+'):
+            elif step == 'insert':
                 # Line was added (is in chosen, wasn't in rejected)
                 highlights.append(DiffHighlight(
-                    start_line=current_line,
-                    end_line=current_line + 1,
+                    start_line=j,
+                    end_line=j + 1,
                     highlight_type='added',
-                    content=[line[1:]]
+                    content=[chosen_lines[j]]
                 ))
-                current_line += 1
-            elif not line.startswith('@@') and not line.startswith('\\'):
-                current_line += 1
         
         return highlights
     
@@ -274,61 +608,114 @@ class DiffHighlighter:
             return text
         
         lines = text.splitlines()
-        highlighted_lines = []
         
-        for i, line in enumerate(lines):
-            line_highlighted = False
-            
-            for highlight in highlights:
-                if highlight.start_line <= i < highlight.end_line:
-                    if highlight.highlight_type == 'added':
-                        highlighted_lines.append(f"[+] {line}")
-                    elif highlight.highlight_type == 'removed':
-                        highlighted_lines.append(f"[-] {line}")
-                    else:
-                        highlighted_lines.append(f"[~] {line}")
-                    line_highlighted = True
-                    break
-            
-            if not line_highlighted:
-                highlighted_lines.append(f"    {line}")
+        # One prefix per line, filled a highlight at a time with slice assignments.
+        # Going backwards lets the first highlight covering a line win
+        prefixes = ["    "] * len(lines)
+        for highlight in reversed(highlights):
+            start = max(highlight.start_line, 0)
+            end = min(highlight.end_line, len(lines))
+            if start < end:
+                prefix = DiffHighlighter._HIGHLIGHT_PREFIXES.get(highlight.highlight_type, "[~] ")
+                prefixes[start:end] = [prefix] * (end - start)
         
+        highlighted_lines = map(operator.add, prefixes, lines)
         return '\n'.join(highlighted_lines)
     
     @staticmethod
-    def create_rejection_preview(chosen_content: List[str], rejected_content: List[str]) -> str:
+    def create_rejection_preview(chosen_content: List[str], rejected_content: List[str],
+                                 pool: Optional[Dict[str, int]] = None,
+                                 content_hashes: Optional[Tuple[int, int]] = None) -> str:
         """Create a preview showing what was rejected with diff highlighting"""
         if not rejected_content:
             return "// No alternative content to show"
         
         preview_lines = ["// ===== REJECTED ALTERNATIVE ====="]
         
-        if chosen_content == rejected_content:
+        # Different hashes rule out equal content without walking both lists
+        maybe_identical = content_hashes is None or content_hashes[0] == content_hashes[1]
+        if maybe_identical and chosen_content == rejected_content:
             preview_lines.append("// (Identical to chosen content)")
-            preview_lines.extend(f"// {line}" for line in rejected_content)
+            preview_lines.append(f"// ({len(rejected_content)} identical lines omitted)")
         else:
-            # Show the rejected content with diff markers
-            differ = difflib.unified_diff(
-                chosen_content, rejected_content,
-                lineterm='', n=1
-            )
+            ops = DiffHighlighter._diff_ops(chosen_content, rejected_content, pool)
+            
+            # Group changes into hunks with one line of context, like a unified diff
+            hunks = []
+            for n, (step, _, _) in enumerate(ops):
+                if step == 'keep':
+                    continue
+                if hunks and n - hunks[-1][1] <= 3:
+                    hunks[-1][1] = n
+                else:
+                    hunks.append([n, n])
             
-            in_diff = False
-            for line in differ:
-                if line.startswith('@@'):
-                    in_diff = True
-                    preview_lines.append(f"// {line}")
-                elif line.startswith('-'):
-                    preview_lines.append(f"// CHOSEN:   {line[1:]}")
-                elif line.startswith('+'):
-                    preview_lines.append(f"// REJECTED: {line[1:]}")
-                elif line.startswith(' ') and in_diff:
-                    preview_lines.append(f"//          {line[1:]}")
+            # Show the rejected content with diff markers
+            for first, last in hunks:
+                hunk = ops[max(first - 1, 0):last + 2]
+                chosen_length = sum(1 for step, _, _ in hunk if step != 'insert')
+                rejected_length = sum(1 for step, _, _ in hunk if step != 'delete')
+                chosen_range = DiffHighlighter._format_range(hunk[0][1], chosen_length)
+                rejected_range = DiffHighlighter._format_range(hunk[0][2], rejected_length)
+                preview_lines.append(f"// @@ -{chosen_range} +{rejected_range} @@")
+                
+                for step, i, j in hunk:
+                    if step == 'delete':
+                        preview_lines.append(f"// CHOSEN:   {chosen_content[i]}")
+                    elif step == 'insert':
+                        preview_lines.append(f"// REJECTED: {rejected_content[j]}")
+                    else:
+                        preview_lines.append(f"//          {chosen_content[i]}")
         
         preview_lines.append("// ===== END REJECTED =====")
         return '\n'.join(preview_lines)
 
 
+class PieceTable:
+    """Line buffer that splices in replacement lines without copying the unchanged text"""
+    
+    def __init__(self, lines: Sequence[str]):
+        # Each piece is (buffer, first line, stop line); offsets holds each piece's first
+        # line in the document, followed by the total line count
+        self._pieces: List[Tuple[Sequence[str], int, int]] = [(lines, 0, len(lines))] if lines else []
+        self._offsets: List[int] = [0, len(lines)] if lines else [0]
+    
+    @property
+    def line_count(self) -> int:
+        return self._offsets[-1]
+    
+    def _split(self, line: int) -> int:
+        """Make sure a piece starts at line, returning that piece's index"""
+        line = min(max(line, 0), self.line_count)
+        index = bisect.bisect_right(self._offsets, line) - 1
+        if index == len(self._pieces) or self._offsets[index] == line:
+            return index
+        
+        buffer, first, stop = self._pieces[index]
+        cut = first + line - self._offsets[index]
+        self._pieces[index:index + 1] = [(buffer, first, cut), (buffer, cut, stop)]
+        self._offsets.insert(index + 1, line)
+        return index + 1
+    
+    def replace_lines(self, start: int, end: int, new_lines: Sequence[str]) -> None:
+        """Replace lines start..end (exclusive) with new_lines"""
+        first = self._split(start)
+        last = self._split(end)
+        self._pieces[first:last] = [(new_lines, 0, len(new_lines))] if new_lines else []
+        
+        # Only the offsets from the replaced piece onwards move
+        del self._offsets[first + 1:]
+        position = self._offsets[first]
+        for _, piece_first, piece_stop in self._pieces[first:]:
+            position += piece_stop - piece_first
+            self._offsets.append(position)
+    
+    def to_string(self) -> str:
+        return '\n'.join(itertools.chain.from_iterable(
+            buffer[first:stop] for buffer, first, stop in self._pieces
+        ))
+
+
 class GitMergeApp:
     """Main application class with Git integration"""
     
@@ -336,17 +723,32 @@ class GitMergeApp:
         self.git_repo: Optional[GitRepository] = None
         self.current_file: Optional[Path] = None
         self.conflicted_files: List[GitFileStatus] = []
+        self._conflicted_file_names: List[str] = []
         self.current_conflicts: List[ConflictMarkers] = []
         self.original_conflicts: List[ConflictMarkers] = []
         self.file_versions: Dict[str, str] = {}
         self.selected_conflict_index: int = -1
         self.original_content: str = ""
+        self._original_lines: List[str] = []
         self.diff_highlighter = DiffHighlighter()
+        self._line_pool: Dict[str, int] = {}
+        self._parsed_content: str = ""
+        self._parsed_marker_counts: Tuple[int, ...] = ()
+        self._ui_cache: Dict[str, object] = {}
+        self._conflict_previews: List[str] = []
+        self._conflict_items: List[str] = []
+        self._preview_cache: Dict[Tuple[int, str], str] = {}
+        self._buffer: Optional[PieceTable] = None
+        self._local_text: str = ""
+        self._local_text_dirty: bool = False
+        self._local_lines: Optional[List[str]] = None
+        self._edit_timer: Optional[threading.Timer] = None
+        self._edit_generation: int = 0
+        self._edit_results: "queue.SimpleQueue[Tuple[int, str, List[ConflictMarkers]]]" = queue.SimpleQueue()
         self.show_rejection_preview: bool = True
         
         self.setup_dpg()
         self.create_ui()
-        self.initialize_git()
     
     def setup_dpg(self) -> None:
         """Initialize DearPyGui"""
@@ -532,6 +934,46 @@ class GitMergeApp:
         except Exception as e:
             self.update_status(f"No Git repository found: {str(e)}")
     
+    def _get_local(self) -> str:
+        """Working copy text, read from the shadow copy instead of the widget"""
+        return self._local_text
+    
+    def _set_local(self, text: str, push: bool = True) -> None:
+        """Replace the working copy text, sending it to the widget now or on the next frame"""
+        # A re-parse of the typed text it replaces would overwrite the conflicts with stale ones
+        self._cancel_pending_edit()
+        self._local_text = text
+        self._local_text_dirty = True
+        self._local_lines = None
+        if push:
+            self._push_local()
+    
+    def _get_lines(self) -> List[str]:
+        """Working copy split into lines, reused until the text changes (callers must not modify it)"""
+        if self._local_lines is None:
+            self._local_lines = self._local_text.splitlines()
+        return self._local_lines
+    
+    def _push_local(self) -> None:
+        """Send the working copy text to the widget if it changed"""
+        if self._local_text_dirty:
+            dpg.set_value("local_text", self._local_text)
+            self._local_text_dirty = False
+    
+    def _set_ui_value(self, tag: str, value: object) -> None:
+        """Set a display-only item's value, skipping the call if it hasn't changed"""
+        if self._ui_cache.get(tag) != value:
+            dpg.set_value(tag, value)
+            self._ui_cache[tag] = value
+    
+    def _set_ui_items(self, tag: str, items: List[str]) -> None:
+        """Set a listbox's items, skipping the rebuild if they haven't changed"""
+        key = (tag, 'items')
+        items = tuple(items)
+        if self._ui_cache.get(key) != items:
+            dpg.configure_item(tag, items=list(items))
+            self._ui_cache[key] = items
+    
     def update_status(self, message: str) -> None:
         """Update status bar message"""
         dpg.set_value("status_text", message)
@@ -545,8 +987,8 @@ class GitMergeApp:
         try:
             self.conflicted_files = self.git_repo.get_conflicted_files()
             
-            file_names = [str(f.path) for f in self.conflicted_files]
-            dpg.configure_item("conflict_list", items=file_names)
+            self._conflicted_file_names = [str(f.path) for f in self.conflicted_files]
+            dpg.configure_item("conflict_list", items=self._conflicted_file_names)
             
             if self.conflicted_files:
                 self.update_status(f"Found {len(self.conflicted_files)} conflicted files")
@@ -580,25 +1022,32 @@ class GitMergeApp:
             return
         
         try:
+            self._cancel_pending_edit()
             self.current_file = file_path
             dpg.set_value("current_file_label", str(file_path))
             
             self.file_versions = self.git_repo.get_file_versions(file_path)
             
             working_copy = (self.git_repo.repo_path / file_path).read_text(encoding='utf-8')
+            self._set_local(working_copy, push=False)
             self.original_content = working_copy
+            self._original_lines = self._get_lines()
             self.current_conflicts = self.git_repo.parse_conflict_markers(working_copy)
+            self._set_parsed_content(working_copy)
+            
+            # Diffs within this file share line IDs, interned as conflicts are diffed
+            self._line_pool = {}
             
-            # Create backup of original conflicts
+            # Create backup of original conflicts, sharing their immutable sections
             self.original_conflicts = []
             for conflict in self.current_conflicts:
                 original_conflict = ConflictMarkers(
                     start=conflict.start,
                     middle=conflict.middle,
                     end=conflict.end,
-                    base_content=conflict.base_content.copy(),
-                    local_content=conflict.local_content.copy(),
-                    remote_content=conflict.remote_content.copy(),
+                    base_content=conflict.base_content,
+                    local_content=conflict.local_content,
+                    remote_content=conflict.remote_content,
                     conflict_id=conflict.conflict_id,
                     original_start=conflict.start,
                     original_end=conflict.end
@@ -607,10 +1056,12 @@ class GitMergeApp:
             
             # Update UI
             dpg.set_value("base_text", self.file_versions.get('base', 'Not available'))
-            dpg.set_value("local_text", working_copy)
+            self._push_local()
+            self._buffer = None
             dpg.set_value("remote_text", self.file_versions.get('remote', 'Not available'))
             dpg.set_value("rejection_preview", "// Make a choice to see rejected alternative")
             
+            self._rebuild_conflict_items()
             self.update_conflict_display()
             self.selected_conflict_index = 0 if self.current_conflicts else -1
             
@@ -624,28 +1075,37 @@ class GitMergeApp:
         total_conflicts = len(self.current_conflicts)
         resolved_conflicts = sum(1 for c in self.current_conflicts if c.is_resolved)
         
-        dpg.set_value("conflict_count", str(total_conflicts))
-        dpg.set_value("resolved_count", str(resolved_conflicts))
+        self._set_ui_value("conflict_count", str(total_conflicts))
+        self._set_ui_value("resolved_count", str(resolved_conflicts))
         
         # Update individual conflicts list with resolution status
-        conflict_items = []
+        self._set_ui_items("individual_conflicts", self._conflict_items)
+        
+        # Update navigation
+        if self.selected_conflict_index >= 0 and total_conflicts > 0:
+            self._set_ui_value("conflict_nav", f"{self.selected_conflict_index + 1}/{total_conflicts}")
+        else:
+            self._set_ui_value("conflict_nav", "0/0")
+    
+    def _rebuild_conflict_items(self) -> None:
+        """Precompute the conflict list rows after the conflicts have been replaced"""
+        self._preview_cache = {}
+        self._conflict_previews = []
         for i, conflict in enumerate(self.current_conflicts):
-            if conflict.is_resolved:
-                status = f"✓({conflict.resolved_with or 'manual'})"
-            else:
-                status = "✗"
-            
             local_preview = conflict.local_content[0][:25] + "..." if conflict.local_content else "Empty"
             remote_preview = conflict.remote_content[0][:25] + "..." if conflict.remote_content else "Empty"
-            conflict_items.append(f"{status} Conflict {i+1}: {local_preview} vs {remote_preview}")
+            self._conflict_previews.append(f"Conflict {i+1}: {local_preview} vs {remote_preview}")
         
-        dpg.configure_item("individual_conflicts", items=conflict_items)
-        
-        # Update navigation
-        if self.selected_conflict_index >= 0 and total_conflicts > 0:
-            dpg.set_value("conflict_nav", f"{self.selected_conflict_index + 1}/{total_conflicts}")
+        self._conflict_items = [self._conflict_item(i) for i in range(len(self.current_conflicts))]
+    
+    def _conflict_item(self, index: int) -> str:
+        """Conflict list row with the conflict's resolution status"""
+        conflict = self.current_conflicts[index]
+        if conflict.is_resolved:
+            status = f"✓({conflict.resolved_with or 'manual'})"
         else:
-            dpg.set_value("conflict_nav", "0/0")
+            status = "✗"
+        return f"{status} {self._conflict_previews[index]}"
     
     def on_conflict_selected(self, sender, app_data) -> None:
         """Handle individual conflict selection"""
@@ -684,71 +1144,56 @@ class GitMergeApp:
         conflict = self.current_conflicts[self.selected_conflict_index]
         self.update_status(f"Selected conflict {self.selected_conflict_index + 1} at lines {conflict.start}-{conflict.end}")
     
+    @staticmethod
+    def _build_line_sections(n_lines: int, conflicts: Sequence[ConflictMarkers]) -> bytearray:
+        """Section code of every line, taken from the first unresolved conflict covering it"""
+        sections = bytearray(n_lines)
+        
+        # Later conflicts are painted first so earlier ones overwrite them where they overlap
+        for conflict in reversed(conflicts):
+            if conflict.is_resolved:
+                continue
+            start = max(conflict.start, 0)
+            end = min(conflict.end + 1, n_lines)
+            regions = (
+                (start, end, _SECTION_OTHER),
+                (max(conflict.start + 1, start), min(conflict.middle, end), _SECTION_LOCAL),
+                (max(conflict.middle + 1, start), min(conflict.end, end), _SECTION_REMOTE),
+            )
+            for first, stop, section in regions:
+                if first < stop:
+                    sections[first:stop] = bytes((section,)) * (stop - first)
+        
+        return sections
+    
     def show_diff_highlights(self) -> None:
         """Show diff highlighting in the working copy"""
-        content = dpg.get_value("local_text")
+        content = self._get_local()
         if not content:
             return
         
         # This adds simple visual markers - in a more advanced implementation,
         # you'd use proper text highlighting with colors
-        lines = content.splitlines()
-        highlighted_lines = []
+        lines = self._get_lines()
+        sections = self._build_line_sections(len(lines), self.current_conflicts)
+        highlighted_lines = [None] * len(lines)
         
         for i, line in enumerate(lines):
-            if line.startswith('<<<<<<<'):
-                highlighted_lines.append(f"🔴 CONFLICT START: {line}")
-            elif line.startswith('======='):
-                highlighted_lines.append(f"🟡 CONFLICT MIDDLE: {line}")
-            elif line.startswith('>>>>>>>'):
-                highlighted_lines.append(f"🔴 CONFLICT END: {line}")
-            elif line.startswith('|||||||'):
-                highlighted_lines.append(f"🔵 BASE MARKER: {line}")
-            else:
-                # Check if this line is part of a conflict
-                in_conflict = False
-                for conflict in self.current_conflicts:
-                    if conflict.start <= i <= conflict.end and not conflict.is_resolved:
-                        if conflict.start < i < conflict.middle:
-                            highlighted_lines.append(f"🟢 LOCAL: {line}")
-                        elif conflict.middle < i < conflict.end:
-                            highlighted_lines.append(f"🔴 REMOTE: {line}")
-                        else:
-                            highlighted_lines.append(line)
-                        in_conflict = True
-                        break
-                
-                if not in_conflict:
-                    highlighted_lines.append(line)
+            section = _MARKER_SECTIONS.get(line[:7], sections[i])
+            highlighted_lines[i] = _SECTION_PREFIXES[section] + line
         
-        dpg.set_value("local_text", '\n'.join(highlighted_lines))
+        self._set_local('\n'.join(highlighted_lines))
+        self._buffer = None
         self.update_status("Added diff highlighting")
     
     def clear_working_highlights(self) -> None:
         """Clear highlighting from working copy"""
-        content = dpg.get_value("local_text")
+        content = self._get_local()
         if not content:
             return
         
-        lines = content.splitlines()
-        cleaned_lines = []
-        
-        for line in lines:
-            # Remove our highlighting markers
-            if line.startswith('🔴 ') or line.startswith('🟡 ') or line.startswith('🔵 ') or line.startswith('🟢 '):
-                if 'CONFLICT' in line or 'BASE MARKER' in line:
-                    # Keep the actual git markers
-                    cleaned_lines.append(line.split(': ', 1)[1] if ': ' in line else line)
-                elif 'LOCAL: ' in line:
-                    cleaned_lines.append(line.replace('🟢 LOCAL: ', ''))
-                elif 'REMOTE: ' in line:
-                    cleaned_lines.append(line.replace('🔴 REMOTE: ', ''))
-                else:
-                    cleaned_lines.append(line)
-            else:
-                cleaned_lines.append(line)
-        
-        dpg.set_value("local_text", '\n'.join(cleaned_lines))
+        self._set_local(_HIGHLIGHT_STRIP_RE.sub('', content))
+        self._buffer = None
         self.update_status("Cleared diff highlighting")
    
     def clear_all_highlights(self) -> None:
@@ -756,26 +1201,20 @@ class GitMergeApp:
         if self.current_file and self.git_repo:
             try:
                 original_content = (self.git_repo.repo_path / self.current_file).read_text(encoding='utf-8')
-                dpg.set_value("local_text", original_content)
+                self._set_local(original_content)
+                self._buffer = None
                 self.update_status("Cleared all highlights")
             except Exception as e:
                 self.update_status(f"Error clearing highlights: {str(e)}")
     
     def remove_conflict_markers(self) -> None:
         """Remove conflict markers from working copy"""
-        content = dpg.get_value("local_text")
+        content = self._get_local()
         if not content:
             return
         
-        lines = content.splitlines()
-        cleaned_lines = []
-        
-        for line in lines:
-            if not (line.startswith('<<<<<<<') or line.startswith('=======') or 
-                   line.startswith('>>>>>>>') or line.startswith('|||||||')):
-                cleaned_lines.append(line)
-        
-        dpg.set_value("local_text", '\n'.join(cleaned_lines))
+        self._set_local(_MARKER_LINE_RE.sub('', content))
+        self._buffer = None
         self.update_status("Removed conflict markers")
     
     def accept_local_conflict(self) -> None:
@@ -796,61 +1235,85 @@ class GitMergeApp:
             conflict = self.current_conflicts[self.selected_conflict_index]
             self._resolve_single_conflict(conflict, 'base')
     
-    def _resolve_single_conflict(self, conflict: ConflictMarkers, resolution: str) -> None:
-        """Resolve a single conflict with Meld-style highlighting"""
+    @staticmethod
+    def _resolution_content(conflict: ConflictMarkers,
+                            resolution: str) -> Tuple[Sequence[str], Sequence[str], Optional[Tuple[int, int]]]:
+        """Chosen and rejected lines for a resolution, plus their hashes when known"""
         if resolution == 'local':
-            chosen_content = conflict.local_content
-            rejected_content = conflict.remote_content
+            return (conflict.local_content, conflict.remote_content,
+                    (conflict.local_hash, conflict.remote_hash))
         elif resolution == 'remote':
-            chosen_content = conflict.remote_content
-            rejected_content = conflict.local_content
+            return (conflict.remote_content, conflict.local_content,
+                    (conflict.remote_hash, conflict.local_hash))
         else:  # base
-            chosen_content = conflict.base_content
-            rejected_content = conflict.local_content + conflict.remote_content
-        
-        # Mark conflict as resolved
+            return (conflict.base_content, conflict.local_content + conflict.remote_content, None)
+    
+    def _mark_conflict_resolved(self, conflict: ConflictMarkers, resolution: str,
+                                chosen_content: Sequence[str], rejected_content: Sequence[str]) -> None:
+        """Record a resolution on the conflict and its list row"""
         conflict.is_resolved = True
         conflict.resolved_with = resolution
-        conflict.resolved_lines = chosen_content.copy()
-        conflict.rejected_lines = rejected_content.copy()
+        # Sections are immutable tuples, so the resolution can share them
+        conflict.resolved_lines = chosen_content
+        conflict.rejected_lines = rejected_content
+        self._conflict_items[conflict.conflict_id] = self._conflict_item(conflict.conflict_id)
+    
+    def _resolve_single_conflict(self, conflict: ConflictMarkers, resolution: str) -> None:
+        """Resolve a single conflict with Meld-style highlighting"""
+        chosen_content, rejected_content, _ = self._resolution_content(conflict, resolution)
         
-        # Update working copy with resolved content
+        # Update working copy with resolved content (before the previous resolution is overwritten)
         self._update_working_copy_with_resolution(conflict, chosen_content)
         
+        # Mark conflict as resolved
+        self._mark_conflict_resolved(conflict, resolution, chosen_content, rejected_content)
+        
         # Show rejection preview (Meld-style)
-        self._show_rejection_preview(chosen_content, rejected_content, resolution)
+        self._show_rejection_preview(conflict, resolution)
         
         self.update_conflict_display()
         self.update_status(f"Resolved conflict {self.selected_conflict_index + 1} with {resolution}")
     
-    def _update_working_copy_with_resolution(self, conflict: ConflictMarkers, chosen_content: List[str]) -> None:
+    @staticmethod
+    def _conflict_stop(conflict: ConflictMarkers) -> int:
+        """Line after the conflict in the working copy"""
+        # A conflict that was already resolved now spans its previous choice
+        if conflict.is_resolved and conflict.resolved_lines is not None:
+            return conflict.start + len(conflict.resolved_lines)
+        return conflict.end + 1
+    
+    def _update_working_copy_with_resolution(self, conflict: ConflictMarkers, chosen_content: Sequence[str]) -> None:
         """Update working copy by replacing conflict with chosen content"""
-        content = dpg.get_value("local_text")
-        lines = content.splitlines()
-        
-        # Replace conflict section with chosen content
-        new_lines = (
-            lines[:conflict.start] + 
-            chosen_content + 
-            lines[conflict.end + 1:]
-        )
+        if self._buffer is None:
+            self._buffer = PieceTable(self._get_lines())
+        
+        stop = self._conflict_stop(conflict)
+        self._buffer.replace_lines(conflict.start, stop, chosen_content)
         
         # Update line numbers for remaining conflicts
-        lines_removed = (conflict.end - conflict.start + 1) - len(chosen_content)
-        for other_conflict in self.current_conflicts:
-            if other_conflict.conflict_id != conflict.conflict_id and other_conflict.start > conflict.end:
-                other_conflict.start -= lines_removed
-                other_conflict.middle -= lines_removed
-                other_conflict.end -= lines_removed
+        lines_removed = (stop - conflict.start) - len(chosen_content)
+        for other_conflict in self.current_conflicts[conflict.conflict_id + 1:]:
+            other_conflict.start -= lines_removed
+            other_conflict.middle -= lines_removed
+            other_conflict.end -= lines_removed
         
-        dpg.set_value("local_text", '\n'.join(new_lines))
+        self._set_local(self._buffer.to_string())
     
-    def _show_rejection_preview(self, chosen_content: List[str], rejected_content: List[str], resolution: str) -> None:
+    def _show_rejection_preview(self, conflict: ConflictMarkers, resolution: str) -> None:
         """Show the rejected alternative in Meld style"""
         if not self.show_rejection_preview:
             return
         
-        preview_text = self.diff_highlighter.create_rejection_preview(chosen_content, rejected_content)
+        # A conflict's sections don't change until the conflict list is rebuilt, so each
+        # choice only needs diffing once
+        key = (conflict.conflict_id, resolution)
+        preview_text = self._preview_cache.get(key)
+        if preview_text is None:
+            chosen_content, rejected_content, content_hashes = self._resolution_content(conflict, resolution)
+            preview_text = self.diff_highlighter.create_rejection_preview(
+                chosen_content, rejected_content, self._line_pool, content_hashes
+            )
+            self._preview_cache[key] = preview_text
         
         # Add context about the resolution
         header = [
@@ -867,24 +1330,40 @@ class GitMergeApp:
         """Revert selected conflict to original state"""
         if self.selected_conflict_index >= 0 and self.selected_conflict_index < len(self.current_conflicts):
             conflict = self.current_conflicts[self.selected_conflict_index]
-            original = self.original_conflicts[self.selected_conflict_index]
+            if not conflict.is_resolved:
+                self.update_status(f"Conflict {self.selected_conflict_index + 1} is not resolved")
+                return
+            
+            # Splice back the conflict as it was parsed; ids are renumbered by re-parses,
+            # so the load-time conflicts can't be looked up by id
+            self._update_working_copy_with_resolution(conflict, conflict.original_lines)
             
             # Restore original conflict
             conflict.is_resolved = False
             conflict.resolved_with = None
             conflict.resolved_lines = None
             conflict.rejected_lines = None
+            self._conflict_items[conflict.conflict_id] = self._conflict_item(conflict.conflict_id)
             
-            # Reload the file to restore original conflict markers
-            if self.current_file:
-                self.load_conflicted_file(self.current_file)
-            
+            dpg.set_value("rejection_preview", "// Make a choice to see rejected alternative")
+            self.update_conflict_display()
             self.update_status(f"Reverted conflict {self.selected_conflict_index + 1}")
     
     def restore_all_conflicts(self) -> None:
         """Restore all conflicts to original state"""
-        if self.current_file:
-            self.load_conflicted_file(self.current_file)
+        if self.current_file and self.git_repo:
+            # Re-parse the content kept from load rather than reading the file again
+            self._cancel_pending_edit()
+            self.current_conflicts = self.git_repo.parse_conflict_markers(self.original_content)
+            self._set_parsed_content(self.original_content)
+            self._set_local(self.original_content)
+            self._local_lines = self._original_lines
+            self._buffer = None
+            
+            self._rebuild_conflict_items()
+            self.update_conflict_display()
+            self.selected_conflict_index = 0 if self.current_conflicts else -1
+            
             dpg.set_value("rejection_preview", "// All conflicts restored to original state")
             self.update_status("Restored all conflicts to original state")
     
@@ -893,37 +1372,133 @@ class GitMergeApp:
         if not self.current_conflicts:
             return
         
-        for conflict in self.current_conflicts:
-            if not conflict.is_resolved:
-                self._resolve_single_conflict(conflict, version)
+        pending = [conflict for conflict in self.current_conflicts if not conflict.is_resolved]
+        if pending:
+            self._bulk_resolve(pending, version)
         
         self.update_status(f"Resolved all conflicts with {version}")
     
+    def _bulk_resolve(self, conflicts: List[ConflictMarkers], resolution: str) -> None:
+        """Resolve several conflicts with one working copy update"""
+        if self._buffer is None:
+            self._buffer = PieceTable(self._get_lines())
+        
+        # Splice right to left so earlier conflicts keep their line numbers
+        lines_removed: Dict[int, int] = {}
+        for conflict in sorted(conflicts, key=operator.attrgetter('start'), reverse=True):
+            chosen_content, rejected_content, _ = self._resolution_content(conflict, resolution)
+            stop = self._conflict_stop(conflict)
+            self._buffer.replace_lines(conflict.start, stop, chosen_content)
+            lines_removed[conflict.conflict_id] = (stop - conflict.start) - len(chosen_content)
+            self._mark_conflict_resolved(conflict, resolution, chosen_content, rejected_content)
+        
+        # Shift every conflict by the lines removed before it in a single pass
+        shift = 0
+        for conflict in self.current_conflicts:
+            conflict.start -= shift
+            conflict.middle -= shift
+            conflict.end -= shift
+            shift += lines_removed.get(conflict.conflict_id, 0)
+        
+        self._set_local(self._buffer.to_string())
+        
+        # The preview shows the last conflict, as resolving them one by one would
+        self._show_rejection_preview(conflicts[-1], resolution)
+        self.update_conflict_display()
+    
     def mark_resolved(self) -> None:
         """Mark current file as resolved in Git"""
         if not self.current_file or not self.git_repo:
             return
         
-        content = dpg.get_value("local_text")
-        if self.git_repo.resolve_conflict(self.current_file, content):
+        content = self._get_local()
+        if self.git_repo.resolve_conflicts([(self.current_file, content)]):
             self.update_status(f"Marked {self.current_file} as resolved in Git")
             # Remove from conflicted files list
-            self.conflicted_files = [f for f in self.conflicted_files if f.path != self.current_file]
-            file_names = [str(f.path) for f in self.conflicted_files]
-            dpg.configure_item("conflict_list", items=file_names)
+            try:
+                index = self._conflicted_file_names.index(str(self.current_file))
+            except ValueError:
+                pass
+            else:
+                del self.conflicted_files[index]
+                del self._conflicted_file_names[index]
+                dpg.configure_item("conflict_list", items=self._conflicted_file_names)
         else:
             self.update_status("Failed to mark file as resolved")
     
-    def on_text_edited(self) -> None:
+    def on_text_edited(self, sender=None, app_data=None) -> None:
         """Handle manual text editing in working copy"""
-        # Check if conflicts have been manually resolved
-        content = dpg.get_value("local_text")
-        remaining_conflicts = self.git_repo.parse_conflict_markers(content) if self.git_repo else []
+        # The widget already holds the edit, so only the shadow copy needs it
+        content = app_data if isinstance(app_data, str) else dpg.get_value("local_text")
+        self._local_text = content
+        self._local_text_dirty = False
+        self._local_lines = None
+        self._buffer = None
         
-        if len(remaining_conflicts) != len(self.current_conflicts):
-            self.current_conflicts = remaining_conflicts
-            self.update_conflict_display()
-            self.update_status("Content manually edited - conflict list updated")
+        # A re-parse queued for earlier text is superseded by this edit
+        self._cancel_pending_edit()
+        
+        # The conflict list only changes when the conflict count does, which needs the
+        # markers to change; counting them is far cheaper than parsing
+        if self._marker_counts(content) == self._parsed_marker_counts:
+            return
+        
+        # Wait for typing to pause, then re-parse off the UI thread
+        self._edit_timer = threading.Timer(
+            _EDIT_DEBOUNCE_SECONDS,
+            self._reparse_edited_text,
+            args=(self._edit_generation, content)
+        )
+        self._edit_timer.daemon = True
+        self._edit_timer.start()
+    
+    @staticmethod
+    def _marker_counts(content: str) -> Tuple[int, ...]:
+        """Number of lines starting with each kind of conflict marker"""
+        return tuple(
+            content.count('\n' + marker) + content.startswith(marker)
+            for marker in _MARKER_SECTIONS
+        )
+    
+    def _set_parsed_content(self, content: str) -> None:
+        """Remember the last parsed text and its marker counts"""
+        self._parsed_content = content
+        self._parsed_marker_counts = self._marker_counts(content)
+    
+    def _cancel_pending_edit(self) -> None:
+        """Drop any re-parse that hasn't been applied yet"""
+        if self._edit_timer is not None:
+            self._edit_timer.cancel()
+            self._edit_timer = None
+        self._edit_generation += 1
+    
+    def _reparse_edited_text(self, generation: int, content: str) -> None:
+        """Parse conflict markers in edited text (runs on the debounce timer's thread)"""
+        if self.git_repo:
+            remaining_conflicts = self.git_repo.reparse_conflict_markers(self._parsed_content, content)
+        else:
+            remaining_conflicts = []
+        self._edit_results.put((generation, content, remaining_conflicts))
+    
+    def _apply_edit_results(self) -> None:
+        """Apply finished re-parses to the UI (runs on the main thread)"""
+        while True:
+            try:
+                generation, content, remaining_conflicts = self._edit_results.get_nowait()
+            except queue.Empty:
+                return
+            
+            # Results from before a newer edit or a file reload are stale
+            if generation != self._edit_generation:
+                continue
+            
+            # Check if conflicts have been manually resolved
+            self._set_parsed_content(content)
+            if len(remaining_conflicts) != len(self.current_conflicts):
+                self.current_conflicts = remaining_conflicts
+                self._rebuild_conflict_items()
+                self.update_conflict_display()
+                self.update_status("Content manually edited - conflict list updated")
     
     def toggle_rejection_preview(self, sender, app_data) -> None:
         """Toggle rejection preview visibility"""
@@ -944,8 +1519,20 @@ class GitMergeApp:
     def run(self) -> None:
         """Run the application"""
         dpg.show_viewport()
-        dpg.start_dearpygui()
+        
+        # Open the repository once the window is up, so startup doesn't wait on git
+        dpg.render_dearpygui_frame()
+        self.initialize_git()
+        
+        while dpg.is_dearpygui_running():
+            self._apply_edit_results()
+            self._push_local()
+            dpg.render_dearpygui_frame()
         dpg.destroy_context()
+        
+        self._cancel_pending_edit()
+        if self.git_repo:
+            self.git_repo.close()
 
 
 if __name__ == "__main__":
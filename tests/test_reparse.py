@@ -0,0 +1,54 @@
+"""Incremental conflict re-parsing must agree with a full parse"""
+
+import random
+
+import pytest
+
+pytest.importorskip("dearpygui")
+
+from main import GitRepository  # noqa: E402
+
+
+# Marker lines, lines with other line breaks and plain text, mixed at random
+LINES = [
+    '<<<<<<<', '<<<<<<< a', '|||||||', '||||||| c', '=======', '>>>>>>> b',
+    'x\x0c<<<<<<<', '\r', 'x', 'y', 'z', '',
+]
+
+
+def random_edit(rng, lines):
+    """Delete, insert or replace a few lines"""
+    lines = list(lines)
+    for _ in range(rng.randint(0, 3)):
+        op = rng.random()
+        if lines and op < 0.3:
+            del lines[rng.randrange(len(lines))]
+        elif op < 0.6:
+            lines.insert(rng.randint(0, len(lines)), rng.choice(LINES))
+        elif lines:
+            lines[rng.randrange(len(lines))] = rng.choice(LINES)
+    return lines
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_reparse_matches_full_parse(seed):
+    rng = random.Random(seed)
+    for _ in range(2000):
+        old_lines = [rng.choice(LINES) for _ in range(rng.randint(0, 25))]
+        new_lines = random_edit(rng, old_lines)
+        old_content = '\n'.join(old_lines) + rng.choice(['', '\n'])
+        new_content = '\n'.join(new_lines) + rng.choice(['', '\n'])
+
+        expected = GitRepository.parse_conflict_markers(new_content)
+        reparsed = GitRepository.reparse_conflict_markers(old_content, new_content)
+        assert reparsed == expected, (old_content, new_content)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_original_lines_match_parsed_text(seed):
+    rng = random.Random(seed)
+    for _ in range(2000):
+        content = '\n'.join(rng.choice(LINES) for _ in range(rng.randint(0, 25))) + rng.choice(['', '\n'])
+        lines = content.splitlines()
+        for conflict in GitRepository.parse_conflict_markers(content):
+            assert list(conflict.original_lines) == lines[conflict.start:conflict.end + 1], content